@@ -76,7 +76,11 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.reload import async_integration_yaml_config
 
-from .common import TuyaDevice, async_config_entry_by_device_id
+from .common import (
+    TuyaDevice,
+    async_config_entry_by_device_id,
+    clear_entity_index,
+)
 from .config_flow import config_schema
 from .const import CONF_PRODUCT_KEY, CONF_ZIGBEE, CONF_ZIGBEE_CID, DATA_DISCOVERY, DOMAIN, TUYA_DEVICE
 from .discovery import TuyaDiscovery
@@ -285,6 +289,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     hass.data[DOMAIN][entry.entry_id][UNSUB_LISTENER]()
     await hass.data[DOMAIN][entry.entry_id][TUYA_DEVICE].close()
+    clear_entity_index(entry)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
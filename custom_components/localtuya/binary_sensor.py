@@ -53,7 +53,7 @@ class LocaltuyaBinarySensor(LocalTuyaEntity, BinarySensorEntity):
 
     def status_updated(self):
         """Device status was updated."""
-        state = str(self.dps(self._dp_id)).lower()
+        state = str(self.dps(self._dp_id_str)).lower()
         if state == self._config[CONF_STATE_ON].lower():
             self._is_on = True
         elif state == self._config[CONF_STATE_OFF].lower():
@@ -54,6 +54,9 @@ DEFAULT_TEMPERATURE_UNIT = TEMPERATURE_CELSIUS
 DEFAULT_PRECISION = PRECISION_TENTHS
 DEFAULT_TEMPERATURE_STEP = PRECISION_HALVES
 
+PRECISION_CHOICES = [PRECISION_WHOLE, PRECISION_HALVES, PRECISION_TENTHS]
+TEMPERATURE_UNIT_CHOICES = [TEMPERATURE_CELSIUS, TEMPERATURE_FAHRENHEIT]
+
 PRESET_REMAP = {
     PRESET_AWAY: "holiday",
     PRESET_BOOST: PRESET_BOOST.upper(),
@@ -64,24 +67,24 @@ HVAC_PRESET_REMAP = {
     HVAC_MODE_HEAT: PRESET_REMAP[PRESET_HOME]
 }
 
+# Reverse lookups from device values, used when reading state
+_PRESET_REMAP_REV = {v: k for k, v in PRESET_REMAP.items()}
+_HVAC_PRESET_REMAP_REV = {v: k for k, v in HVAC_PRESET_REMAP.items()}
+
+PRESET_MODES = [PRESET_COMFORT, PRESET_ECO, *PRESET_REMAP.keys()]
+
 def flow_schema(dps):
     """Return schema used in config flow."""
     return {
         vol.Optional(CONF_TARGET_TEMPERATURE_DP): vol.In(dps),
         vol.Optional(CONF_CURRENT_TEMPERATURE_DP): vol.In(dps),
-        vol.Optional(CONF_TEMPERATURE_STEP): vol.In(
-            [PRECISION_WHOLE, PRECISION_HALVES, PRECISION_TENTHS]
-        ),
+        vol.Optional(CONF_TEMPERATURE_STEP): vol.In(PRECISION_CHOICES),
         vol.Optional(CONF_HVAC_MODE_DP): vol.In(dps),
         vol.Optional(CONF_PRESET_MODE_DP): vol.In(dps),
         vol.Optional(CONF_MAX_TEMP_DP): vol.In(dps),
         vol.Optional(CONF_MIN_TEMP_DP): vol.In(dps),
-        vol.Optional(CONF_PRECISION): vol.In(
-            [PRECISION_WHOLE, PRECISION_HALVES, PRECISION_TENTHS]
-        ),
-        vol.Optional(CONF_TEMPERATURE_UNIT): vol.In(
-            [TEMPERATURE_CELSIUS, TEMPERATURE_FAHRENHEIT]
-        ),
+        vol.Optional(CONF_PRECISION): vol.In(PRECISION_CHOICES),
+        vol.Optional(CONF_TEMPERATURE_UNIT): vol.In(TEMPERATURE_UNIT_CHOICES),
     }
 
 
@@ -106,17 +109,48 @@ class LocaltuyaClimate(LocalTuyaEntity, ClimateEntity):
         self._hvac_action = None
         self._preset_mode = None
         self._precision = self._config.get(CONF_PRECISION, DEFAULT_PRECISION)
-        print("Initialized climate [{}]".format(self.name))
+        self._target_temperature_step = self._config.get(
+            CONF_TEMPERATURE_STEP, DEFAULT_TEMPERATURE_STEP
+        )
+
+        # Status keys of datapoints used when updating state, None if unset
+        self._target_temperature_dp = self._config_dp(CONF_TARGET_TEMPERATURE_DP)
+        self._current_temperature_dp = self._config_dp(CONF_CURRENT_TEMPERATURE_DP)
+        self._min_temp_dp = self._config_dp(CONF_MIN_TEMP_DP)
+        self._max_temp_dp = self._config_dp(CONF_MAX_TEMP_DP)
+        self._hvac_mode_dp = self._config_dp(CONF_HVAC_MODE_DP)
+        self._preset_mode_dp = self._config_dp(CONF_PRESET_MODE_DP)
+
+        # These only depend on configuration, so resolve them once
+        self._supported_features = 0
+        if self.has_config(CONF_TARGET_TEMPERATURE_DP):
+            self._supported_features |= SUPPORT_TARGET_TEMPERATURE
+        if self.has_config(CONF_PRESET_MODE_DP):
+            self._supported_features |= SUPPORT_PRESET_MODE
+
+        if (
+            self._config.get(CONF_TEMPERATURE_UNIT, DEFAULT_TEMPERATURE_UNIT)
+            == TEMPERATURE_FAHRENHEIT
+        ):
+            self._temperature_unit = TEMP_FAHRENHEIT
+        else:
+            self._temperature_unit = TEMP_CELSIUS
+
+        self._hvac_modes = []
+        if self.has_config(CONF_HVAC_MODE_DP):
+            self._hvac_modes = [HVAC_MODE_AUTO, HVAC_MODE_HEAT]
+            if not self.has_config(CONF_ZIGBEE):
+                self._hvac_modes.append(HVAC_MODE_OFF)
+        _LOGGER.debug("Initialized climate [%s]", self.name)
+
+    def _config_dp(self, conf_item):
+        """Return status key of datapoint for a config item or None if unset."""
+        return str(self._config[conf_item]) if self.has_config(conf_item) else None
 
     @property
     def supported_features(self):
         """Flag supported features."""
-        supported_features = 0
-        if self.has_config(CONF_TARGET_TEMPERATURE_DP):
-            supported_features = supported_features | SUPPORT_TARGET_TEMPERATURE
-        if self.has_config(CONF_PRESET_MODE_DP):
-            supported_features = supported_features | SUPPORT_PRESET_MODE
-        return supported_features
+        return self._supported_features
 
     @property
     def precision(self):
@@ -126,19 +160,14 @@ class LocaltuyaClimate(LocalTuyaEntity, ClimateEntity):
     @property
     def temperature_unit(self):
         """Return the unit of measurement used by the platform."""
-        if (
-            self._config.get(CONF_TEMPERATURE_UNIT, DEFAULT_TEMPERATURE_UNIT)
-            == TEMPERATURE_FAHRENHEIT
-        ):
-            return TEMP_FAHRENHEIT
-        return TEMP_CELSIUS
+        return self._temperature_unit
 
     @property
     def hvac_mode(self):
         """Return current operation ie. heat, cool, idle."""
-        for mode in HVAC_PRESET_REMAP:
-            if HVAC_PRESET_REMAP[mode] == self._preset_mode:
-                return mode
+        mode = _HVAC_PRESET_REMAP_REV.get(self._preset_mode)
+        if mode:
+            return mode
 
         if self._hvac_mode in self.hvac_modes:
             return self._hvac_mode
@@ -148,12 +177,7 @@ class LocaltuyaClimate(LocalTuyaEntity, ClimateEntity):
     @property
     def hvac_modes(self):
         """Return the list of available operation modes."""
-        modes = []
-        if (self.has_config(CONF_HVAC_MODE_DP)):
-            modes = [HVAC_MODE_AUTO, HVAC_MODE_HEAT]
-            if not self.has_config(CONF_ZIGBEE):
-                modes.append(HVAC_MODE_OFF)
-        return modes
+        return self._hvac_modes
 
     @property
     def hvac_action(self):
@@ -164,9 +188,9 @@ class LocaltuyaClimate(LocalTuyaEntity, ClimateEntity):
     def preset_mode(self):
         """Return current preset mode"""
         if (self.has_config(CONF_PRESET_MODE_DP)):
-            for preset in PRESET_REMAP:
-                if PRESET_REMAP[preset] == self._preset_mode:
-                    return preset
+            preset = _PRESET_REMAP_REV.get(self._preset_mode)
+            if preset:
+                return preset
 
             if self._preset_mode in self.preset_modes:
                 return self._preset_mode
@@ -179,7 +203,7 @@ class LocaltuyaClimate(LocalTuyaEntity, ClimateEntity):
     def preset_modes(self):
         """Return the list of available preset modes."""
         if (self.has_config(CONF_PRESET_MODE_DP)):
-            return [PRESET_COMFORT, PRESET_ECO] + list(PRESET_REMAP.keys())
+            return PRESET_MODES
         else:
             return NotImplementedError()
 
@@ -196,7 +220,7 @@ class LocaltuyaClimate(LocalTuyaEntity, ClimateEntity):
     @property
     def target_temperature_step(self):
         """Return the supported step of target temperature."""
-        return self._config.get(CONF_TEMPERATURE_STEP, DEFAULT_TEMPERATURE_STEP)
+        return self._target_temperature_step
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
@@ -236,32 +260,32 @@ class LocaltuyaClimate(LocalTuyaEntity, ClimateEntity):
 
     def status_updated(self):
         """Device status was updated."""
-        self._state = self.dps(self._dp_id)
+        self._state = self.dps(self._dp_id_str)
         self._hvac_action = CURRENT_HVAC_HEAT if self._state else CURRENT_HVAC_IDLE
 
-        if self.has_config(CONF_TARGET_TEMPERATURE_DP):
-            self._target_temperature = (
-                self.dps_conf(CONF_TARGET_TEMPERATURE_DP) * self._precision
-            )
+        if self._target_temperature_dp is not None:
+            value = self.dps(self._target_temperature_dp)
+            if value is not None:
+                self._target_temperature = value * self._precision
 
-        if self.has_config(CONF_CURRENT_TEMPERATURE_DP):
-            self._current_temperature = (
-                self.dps_conf(CONF_CURRENT_TEMPERATURE_DP) * self._precision
-            )
+        if self._current_temperature_dp is not None:
+            value = self.dps(self._current_temperature_dp)
+            if value is not None:
+                self._current_temperature = value * self._precision
 
-        if self.has_config(CONF_MIN_TEMP_DP):
-            self._min_temp = self.dps_conf(CONF_MIN_TEMP_DP)
+        if self._min_temp_dp is not None:
+            self._min_temp = self.dps(self._min_temp_dp)
 
-        if self.has_config(CONF_MAX_TEMP_DP):
-            self._max_temp = self.dps_conf(CONF_MAX_TEMP_DP)
+        if self._max_temp_dp is not None:
+            self._max_temp = self.dps(self._max_temp_dp)
 
-        if self.has_config(CONF_HVAC_MODE_DP):
-            self._hvac_mode = self.dps_conf(CONF_HVAC_MODE_DP)
+        if self._hvac_mode_dp is not None:
+            self._hvac_mode = self.dps(self._hvac_mode_dp)
         else:
             self._hvac_mode = HVAC_MODE_HEAT
-        
-        if self.has_config(CONF_PRESET_MODE_DP):
-            self._preset_mode = self.dps_conf(CONF_PRESET_MODE_DP)
+
+        if self._preset_mode_dp is not None:
+            self._preset_mode = self.dps(self._preset_mode_dp)
 
 
-async_setup_entry = partial(async_setup_entry, DOMAIN, LocaltuyaClimate, flow_schema)
\ No newline at end of file
+async_setup_entry = partial(async_setup_entry, DOMAIN, LocaltuyaClimate, flow_schema)
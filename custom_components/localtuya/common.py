@@ -1,6 +1,7 @@
 """Code shared between all platforms."""
 import asyncio
 import logging
+from functools import lru_cache
 
 from homeassistant.const import (
     CONF_DEVICE_ID,
@@ -34,20 +35,8 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def prepare_setup_entities(hass, config_entry, platform):
-    """Prepare ro setup entities for a platform."""
-    entities_to_setup = [
-        entity
-        for entity in config_entry.data[CONF_ENTITIES]
-        if entity[CONF_PLATFORM] == platform
-    ]
-    if not entities_to_setup:
-        return None, None
-
-    tuyainterface = hass.data[DOMAIN][config_entry.entry_id][TUYA_DEVICE]
-
-    return tuyainterface, entities_to_setup
+# Entity configs per config entry id, see _entity_index
+_ENTITY_INDEX = {}
 
 
 async def async_setup_entry(
@@ -58,20 +47,21 @@ async def async_setup_entry(
     This is a generic method and each platform should lock domain and
     entity_class with functools.partial.
     """
-    tuyainterface, entities_to_setup = prepare_setup_entities(
-        hass, config_entry, domain
-    )
-    if not entities_to_setup:
-        return
-
-    dps_config_fields = list(get_dps_for_platform(flow_schema))
+    tuyainterface = hass.data[DOMAIN][config_entry.entry_id][TUYA_DEVICE]
+    dps_config_fields = get_dps_for_platform(flow_schema)
 
     entities = []
-    for device_config in entities_to_setup:
-        # Add DPS used by this platform to the request list
-        for dp_conf in dps_config_fields:
-            if dp_conf in device_config:
-                tuyainterface.dps_to_request[device_config[dp_conf]] = None
+    dps_to_request = []
+    for device_config in config_entry.data[CONF_ENTITIES]:
+        if device_config[CONF_PLATFORM] != domain:
+            continue
+
+        # Collect DPS used by this platform for the request list
+        dps_to_request.extend(
+            device_config[dp_conf]
+            for dp_conf in dps_config_fields
+            if dp_conf in device_config
+        )
 
         id = f"{device_config[CONF_ZIGBEE][CONF_ZIGBEE_CID]}_{device_config[CONF_ID]}" if CONF_ZIGBEE in device_config else device_config[CONF_ID]
         entities.append(
@@ -82,26 +72,66 @@ async def async_setup_entry(
             )
         )
 
-    async_add_entities(entities)
+    if entities:
+        tuyainterface.dps_to_request.update(dict.fromkeys(dps_to_request))
+        async_add_entities(entities)
 
 
+@lru_cache(maxsize=None)
 def get_dps_for_platform(flow_schema):
-    """Return config keys for all platform keys that depends on a datapoint."""
-    for key, value in flow_schema(None).items():
-        if hasattr(value, "container") and value.container is None:
-            yield key.schema
+    """Return config keys for all platform keys that depends on a datapoint.
+
+    The result only depends on the platform schema, so it is computed once per
+    platform instead of building the schema again for every config entry.
+    """
+    return tuple(
+        key.schema
+        for key, value in flow_schema(None).items()
+        if getattr(value, "container", False) is None
+    )
+
+
+def _entity_index(config_entry):
+    """Return entity configs of a config entry indexed by id and cid.
+
+    The index is rebuilt whenever the entity list of the entry is replaced,
+    e.g. when the config entry is updated.
+    """
+    entities = config_entry.data[CONF_ENTITIES]
+    cached = _ENTITY_INDEX.get(config_entry.entry_id)
+    if cached is not None and cached[0] is entities:
+        return cached[1], cached[2]
+
+    by_id = {}
+    by_cid = {}
+    for entity in entities:
+        by_id.setdefault(entity[CONF_ID], entity)
+        if CONF_ZIGBEE in entity:
+            by_cid.setdefault(entity[CONF_ZIGBEE][CONF_ZIGBEE_CID], entity)
+
+    _ENTITY_INDEX[config_entry.entry_id] = (entities, by_id, by_cid)
+    return by_id, by_cid
+
+
+def clear_entity_index(config_entry):
+    """Drop cached entity configs of a config entry."""
+    _ENTITY_INDEX.pop(config_entry.entry_id, None)
 
 
 def get_entity_config(config_entry, dp_id, cid=None):
     """Return entity config for a given DPS id."""
-    for entity in config_entry.data[CONF_ENTITIES]:
-        if cid:
-            if entity[CONF_ZIGBEE][CONF_ZIGBEE_CID] == cid:
-                return entity
-        else:
-            if entity[CONF_ID] == dp_id:
-                return entity
-    raise Exception("missing entity config for " + f"cid {cid}" if cid else f"id {dp_id}")
+    by_id, by_cid = _entity_index(config_entry)
+    entity = by_cid.get(cid) if cid else by_id.get(dp_id)
+    if entity is None:
+        raise Exception(
+            "missing entity config for " + (f"cid {cid}" if cid else f"id {dp_id}")
+        )
+    return entity
+
+
+def subdevice_signal(signal, cid):
+    """Return dispatcher signal used for status of a zigbee sub device."""
+    return f"{signal}_cid_{cid}"
 
 
 @callback
@@ -124,14 +154,24 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
         self._config_entry = config_entry
         self._interface = None
         self._status = {}
-        self.dps_to_request = {}
         self._is_closing = False
         self._connect_task = None
+        self._refresh_callbacks = {}
+        self._not_connected_msg = (
+            f"Not connected to device {config_entry[CONF_FRIENDLY_NAME]}"
+        )
+        self._signal = f"localtuya_{config_entry[CONF_DEVICE_ID]}"
+        self._subdevice_signals = {
+            subdevice_signal(self._signal, entity[CONF_ZIGBEE][CONF_ZIGBEE_CID])
+            for entity in config_entry[CONF_ENTITIES]
+            if CONF_ZIGBEE in entity
+        }
         self.set_logger(_LOGGER, config_entry[CONF_DEVICE_ID])
 
         # This has to be done in case the device type is type_0d
-        for entity in config_entry[CONF_ENTITIES]:
-            self.dps_to_request[entity[CONF_ID]] = None
+        self.dps_to_request = dict.fromkeys(
+            entity[CONF_ID] for entity in config_entry[CONF_ENTITIES]
+        )
 
     @property
     def connected(self):
@@ -197,7 +237,7 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
             except Exception:  # pylint: disable=broad-except
                 self.exception("Failed to set DP %d to %d", dp_index, state)
         else:
-            self.error("Not connected to device %s", self._config_entry[CONF_FRIENDLY_NAME])
+            self.error(self._not_connected_msg)
 
     async def set_dps(self, states, cid=None):
         """Change value of a DPs of the Tuya device."""
@@ -207,7 +247,7 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
             except Exception:  # pylint: disable=broad-except
                 self.exception("Failed to set DPs %r", states)
         else:
-            self.error("Not connected to device %s", self._config_entry[CONF_FRIENDLY_NAME])
+            self.error(self._not_connected_msg)
 
     async def refresh_subdevice(self, cid, dp, value, initial_value=None):
         """Refresh zigbee subdevice."""
@@ -224,8 +264,6 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
             await self.status(cid)
 
         self.debug(f"Forcing refresh for sub device {cid}")
-        if not hasattr(self, '_refresh_callbacks'):
-            self._refresh_callbacks = {}
         self._refresh_callbacks[cid] = refresh_callback 
         await self._interface.set_dps({dp: value}, cid)
 
@@ -243,9 +281,7 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
             except Exception:  # pylint: disable=broad-except
                 self.exception("Failed to get status " + f"for sub device {cid}" if cid else "")
         else:
-            self.error(
-                "Not connected to device %s", self._config_entry[CONF_FRIENDLY_NAME]
-            )
+            self.error(self._not_connected_msg)
 
     @callback
     def status_updated(self, status, cid=None):
@@ -256,17 +292,20 @@ class TuyaDevice(pytuya.TuyaListener, pytuya.ContextualLogger):
             else:
                 self._status[cid] = status[cid]
 
+            # Only entities of this sub device are interested in the update
+            async_dispatcher_send(
+                self._hass, subdevice_signal(self._signal, cid), self._status[cid]
+            )
         else:
             self._status.update(status)
-
-        signal = f"localtuya_{self._config_entry[CONF_DEVICE_ID]}"
-        async_dispatcher_send(self._hass, signal, self._status)
+            async_dispatcher_send(self._hass, self._signal, self._status)
 
     @callback
     def disconnected(self):
         """Device disconnected."""
-        signal = f"localtuya_{self._config_entry[CONF_DEVICE_ID]}"
-        async_dispatcher_send(self._hass, signal, None)
+        async_dispatcher_send(self._hass, self._signal, None)
+        for signal in self._subdevice_signals:
+            async_dispatcher_send(self._hass, signal, None)
 
         self._interface = None
         self.debug("Disconnected - waiting for discovery broadcast")
@@ -283,11 +322,44 @@ class LocalTuyaEntity(RestoreEntity, pytuya.ContextualLogger):
         else:
             self._dp_id = dp_id
             self._cid = None
+        self._dp_id_str = str(self._dp_id)
 
         self._device = device
         self._config_entry = config_entry
         self._config = get_entity_config(config_entry, self._dp_id, self._cid)
+        self._config_is_set = {
+            key: value is not None and value != "-1"
+            for key, value in self._config.items()
+        }
         self._status = {}
+
+        # Status keys this entity depends on, other DPs are ignored on update.
+        # DPs are configured as integers; other integer options only add keys.
+        self._status_keys = {self._dp_id_str}
+        self._status_keys.update(
+            str(value)
+            for key, value in self._config.items()
+            if self.has_config(key) and isinstance(value, int)
+        )
+
+        self._signal = f"localtuya_{self._config_entry.data[CONF_DEVICE_ID]}"
+        if self._cid:
+            self._signal = subdevice_signal(self._signal, self._cid)
+
+        # Identity of the entity never changes, so build it once
+        device_id = self._config_entry.data[CONF_DEVICE_ID]
+        self._name = self._config[CONF_FRIENDLY_NAME]
+        self._unique_id = f"local_{device_id}_{self._cid or self._dp_id}"
+        self._device_info = {
+            "identifiers": {
+                # Serial numbers are unique identifiers within a specific domain
+                (DOMAIN, f"local_{device_id}")
+            },
+            "name": self._config_entry.data[CONF_FRIENDLY_NAME],
+            "manufacturer": "Unknown",
+            "model": self._config_entry.data.get(CONF_PRODUCT_KEY, "Tuya generic"),
+            "sw_version": self._config_entry.data[CONF_PROTOCOL_VERSION],
+        }
         self.set_logger(logger, self._config_entry.data[CONF_DEVICE_ID])
 
     async def async_added_to_hass(self):
@@ -302,44 +374,40 @@ class LocalTuyaEntity(RestoreEntity, pytuya.ContextualLogger):
 
         async def _update_handler(status):
             """Update entity state when status was updated."""
-            if self._cid:
-                status = status.get(self._cid)
+            if self._cid and status and self._cid in self._device._refresh_callbacks:
+                await self._device._refresh_callbacks[self._cid]()
+                return
+
+            if status:
+                status = {
+                    key: status[key] for key in self._status_keys if key in status
+                }
+            else:
+                status = {}
 
-                if status and self._cid in self._device._refresh_callbacks:
-                    await self._device._refresh_callbacks[self._cid]()
-                    return
+            # Skip state writes if none of the DPs of this entity changed
+            if status == self._status:
+                return
 
+            self._status = status
             if status:
-                self._status = status
                 self.status_updated()
-            else:
-                self._status = {}
 
             self.schedule_update_ha_state()
 
-        signal = f"localtuya_{self._config_entry.data[CONF_DEVICE_ID]}"
         self.async_on_remove(
-            async_dispatcher_connect(self.hass, signal, _update_handler)
+            async_dispatcher_connect(self.hass, self._signal, _update_handler)
         )
 
     @property
     def device_info(self):
         """Return device information for the device registry."""
-        return {
-            "identifiers": {
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, f"local_{self._config_entry.data[CONF_DEVICE_ID]}")
-            },
-            "name": self._config_entry.data[CONF_FRIENDLY_NAME],
-            "manufacturer": "Unknown",
-            "model": self._config_entry.data.get(CONF_PRODUCT_KEY, "Tuya generic"),
-            "sw_version": self._config_entry.data[CONF_PROTOCOL_VERSION],
-        }
+        return self._device_info
 
     @property
     def name(self):
         """Get name of Tuya entity."""
-        return self._config[CONF_FRIENDLY_NAME]
+        return self._name
 
     @property
     def should_poll(self):
@@ -349,21 +417,22 @@ class LocalTuyaEntity(RestoreEntity, pytuya.ContextualLogger):
     @property
     def unique_id(self):
         """Return unique device identifier."""
-        return f"local_{self._config_entry.data[CONF_DEVICE_ID]}_{self._cid or self._dp_id}"
+        return self._unique_id
 
     def has_config(self, attr):
         """Return if a config parameter has a valid value."""
-        value = self._config.get(attr, "-1")
-        return value is not None and value != "-1"
+        return self._config_is_set.get(attr, False)
 
     @property
     def available(self):
         """Return if device is available or not."""
-        return str(self._dp_id) in self._status
+        return self._dp_id_str in self._status
 
     def dps(self, dp_index):
         """Return cached value for DPS index."""
-        value = self._status.get(str(dp_index))
+        if not isinstance(dp_index, str):
+            dp_index = str(dp_index)
+        value = self._status.get(dp_index)
         if value is None:
             self.warning(
                 "Entity %s is requesting unknown DPS index %s",
@@ -75,7 +75,7 @@ class LocaltuyaCover(LocalTuyaEntity, CoverEntity):
         self._state = self._stop_cmd
         self._previous_state = self._state
         self._current_cover_position = 0
-        print("Initialized cover [{}]".format(self.name))
+        _LOGGER.debug("Initialized cover [%s]", self.name)
 
     @property
     def supported_features(self):
@@ -195,7 +195,7 @@ class LocaltuyaCover(LocalTuyaEntity, CoverEntity):
     def status_updated(self):
         """Device status was updated."""
         self._previous_state = self._state
-        self._state = self.dps(self._dp_id)
+        self._state = self.dps(self._dp_id_str)
         if self._state.isupper():
             self._open_cmd = self._open_cmd.upper()
             self._close_cmd = self._close_cmd.upper()
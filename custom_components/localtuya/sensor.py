@@ -60,7 +60,7 @@ class LocaltuyaSensor(LocalTuyaEntity):
 
     def status_updated(self):
         """Device status was updated."""
-        state = self.dps(self._dp_id)
+        state = self.dps(self._dp_id_str)
         scale_factor = self._config.get(CONF_SCALING)
         if scale_factor is not None and isinstance(state, (int, float)):
             state = round(state * scale_factor, DEFAULT_PRECISION)